@@ -13,11 +13,34 @@ This is intentionally a prototype and not production code.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import asdict, dataclass, field
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
 from datetime import datetime, timedelta, timezone
+from functools import cached_property, lru_cache
 from hashlib import sha256
+import importlib.util
 import json
-from typing import Any, Dict, List, Optional, Tuple
+import multiprocessing
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+try:  # Optional native JSON encoder for the canonical hashing front end.
+    import orjson
+except ImportError:  # pragma: no cover - depends on local environment
+    orjson = None
+
+try:  # Optional multi-buffer SHA-256 (SHA-NI / AVX2 lanes) for 64-byte nodes.
+    import hashtree as _hashtree
+except ImportError:  # pragma: no cover - depends on local environment
+    _hashtree = None
+
+try:  # Optional compiled level loop (``cythonize -i merkle_core.pyx``).
+    import merkle_core as _merkle_core
+except ImportError:  # pragma: no cover - depends on local environment
+    _merkle_core = None
 
 
 # -------------------------------
@@ -25,29 +48,276 @@ from typing import Any, Dict, List, Optional, Tuple
 # -------------------------------
 
 
-def canonical_serialize(data: Any) -> str:
-    """Deterministic JSON encoding to avoid inconsistent hashes."""
-    return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def _json_dumps(data: Any) -> bytes:
+    return _CANONICAL_ENCODER.encode(data).encode("utf-8")
+
+
+_ORJSON_SAFE_SCALARS = frozenset({str, int, bool, type(None)})
+
+
+def _needs_stdlib_encoder(data: Any) -> bool:
+    """True if orjson could encode ``data`` differently from the stdlib encoder.
+
+    That covers non-finite floats, non-zero floats Python prints in exponent
+    form (magnitude below 1e-4 or from 1e16), and any value that is not a
+    plain JSON type: orjson serializes datetimes, UUIDs and dataclasses the
+    stdlib rejects, and treats subclasses differently. Exact type checks
+    keep the walk cheap.
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        kind = type(obj)
+        if kind in _ORJSON_SAFE_SCALARS:
+            continue
+        if kind is float:
+            if obj != 0.0 and not 1e-4 <= abs(obj) < 1e16:
+                return True
+        elif kind is dict:
+            stack.extend(obj.values())
+        elif kind is list or kind is tuple:
+            stack.extend(obj)
+        else:
+            return True
+    return False
+
+
+if orjson is not None:
+
+    def _dumps(data: Any) -> bytes:
+        if _needs_stdlib_encoder(data):
+            return _json_dumps(data)
+        try:
+            return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:  # non-str keys, ints beyond 64 bits, ...
+            return _json_dumps(data)
+
+else:
+    _dumps = _json_dumps
+
+
+def canonical_serialize(data: Any) -> bytes:
+    """Deterministic compact UTF-8 JSON encoding to avoid inconsistent hashes.
+
+    Uses orjson when installed, falling back to the stdlib encoder for any
+    payload orjson would encode differently, so hashes never depend on
+    whether orjson is present.
+    """
+    return _dumps(data)
 
 
 def sha256_hex(payload: bytes) -> str:
     return sha256(payload).hexdigest()
 
 
+def _hash_pairs_hashlib(buf: bytes) -> bytes:
+    """Hash each 64-byte ``left || right`` chunk of ``buf`` into 32 bytes."""
+    view = memoryview(buf)
+    return b"".join(sha256(view[i : i + 64]).digest() for i in range(0, len(view), 64))
+
+
+def _numba_lanes() -> int:
+    """Threads the optional Numba pair kernel would get, or 0 if numba is absent.
+
+    Mirrors numba's NUMBA_NUM_THREADS default without importing numba, which
+    costs ~0.4s and is wasted whenever the kernel is not selected.
+    """
+    if importlib.util.find_spec("numba") is None:
+        return 0
+    if os.environ.get("NUMBA_NUM_THREADS"):
+        return int(os.environ["NUMBA_NUM_THREADS"])
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return os.cpu_count() or 1
+
+
+# Below this many pairs per level, thread fan-out costs more than it saves.
+_NUMBA_MIN_PAIRS = 1024
+
+
+def _hash_pairs_numba(buf: bytes) -> bytes:
+    if len(buf) < _NUMBA_MIN_PAIRS * 64:
+        return _hash_pairs_hashlib(buf)
+    # Imported on first use so processes that never hash a large level
+    # (including spawned validate_chain workers) skip loading numba.
+    from merkle_sha256_numba import hash_pairs_bytes
+
+    return hash_pairs_bytes(buf)
+
+
+def _pair_hasher_is_sound(fn: Any) -> bool:
+    """Check ``fn`` hashes two 64-byte pairs exactly like ``_hash_pairs_hashlib``."""
+    probe = bytes(range(128))
+    try:
+        return callable(fn) and fn(probe) == _hash_pairs_hashlib(probe)
+    except Exception:
+        return False
+
+
+_batch_hash = getattr(_hashtree, "hash", None)
+
+# Level reducer used by merkle_root: maps n*64 bytes of sibling pairs to n*32
+# bytes of parents. The vectorized backend is only used when it passes the
+# self-test above, since any other ``hash`` would silently change every
+# Merkle root; the Numba kernel only when it can run on more than one thread.
+_hash_pairs: Callable[[bytes], bytes]
+if _pair_hasher_is_sound(_batch_hash):
+    _hash_pairs = _batch_hash
+elif _numba_lanes() > 1:
+    _hash_pairs = _hash_pairs_numba
+else:
+    _hash_pairs = _hash_pairs_hashlib
+
+
+@lru_cache(maxsize=4096)
+def _leaf_hash_cached(canon: bytes) -> bytes:
+    return sha256(canon).digest()
+
+
+def _leaf_digest(tx: Dict[str, Any]) -> bytes:
+    # Repeated templates (genesis, rewards, no-ops) and validate_chain
+    # re-walking history hit the cache. Keying on the canonical bytes makes
+    # reuse exact: distinct transactions never share an entry.
+    return _leaf_hash_cached(canonical_serialize(tx))
+
+
 def merkle_root(transactions: List[Dict[str, Any]]) -> str:
-    """Return a simple SHA-256 Merkle root for a list of tx dictionaries."""
+    """Return a simple SHA-256 Merkle root for a list of tx dictionaries.
+
+    Leaves and internal nodes are raw 32-byte digests; each tree level is a
+    flat buffer of sibling pairs so it can be hashed in one batched call. An
+    odd node at the end of a level is paired with itself.
+    """
     if not transactions:
         return sha256_hex(b"")
 
-    leaves = [sha256_hex(canonical_serialize(tx).encode("utf-8")) for tx in transactions]
-    while len(leaves) > 1:
-        nxt: List[str] = []
-        for i in range(0, len(leaves), 2):
-            left = leaves[i]
-            right = leaves[i + 1] if i + 1 < len(leaves) else left
-            nxt.append(sha256_hex(f"{left}{right}".encode("utf-8")))
-        leaves = nxt
-    return leaves[0]
+    level = b"".join(_leaf_digest(tx) for tx in transactions)
+    if _merkle_core is not None and _hash_pairs is _hash_pairs_hashlib:
+        return _merkle_core.merkle_root_bytes(level).hex()
+    while len(level) > 32:
+        if len(level) % 64:
+            level += level[-32:]
+        level = _hash_pairs(level)
+    return level.hex()
+
+
+def _hash_node(left: bytes, right: bytes) -> bytes:
+    return sha256(left + right).digest()
+
+
+class IncrementalMerkle:
+    """Append-only Merkle accumulator that agrees with ``merkle_root``.
+
+    Only the right-most frontier is stored: ``levels[k]`` is the raw 32-byte
+    root of a complete 2**k-leaf subtree still waiting for its right sibling,
+    so each append costs O(log n) hashes instead of rebuilding the whole tree.
+    Only the final root is hex-encoded.
+    """
+
+    def __init__(self) -> None:
+        self.levels: List[Optional[bytes]] = []
+        self.count = 0
+        self._root: Optional[str] = None
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, leaf_digest: bytes) -> None:
+        self._root = None
+        self.count += 1
+        node = leaf_digest
+        for k, sibling in enumerate(self.levels):
+            if sibling is None:
+                self.levels[k] = node
+                return
+            self.levels[k] = None
+            node = _hash_node(sibling, node)
+        self.levels.append(node)
+
+    def append_transaction(self, tx: Dict[str, Any]) -> None:
+        self.append(_leaf_digest(tx))
+
+    def root(self) -> str:
+        if self._root is None:
+            self._root = self._fold()
+        return self._root
+
+    def _fold(self) -> str:
+        # Walk the frontier bottom-up carrying the partial right edge; any
+        # odd node left without a sibling is paired with itself, exactly as
+        # merkle_root does level by level.
+        if not self.count:
+            return sha256_hex(b"")
+        top = len(self.levels) - 1
+        carry: Optional[bytes] = None
+        for k, node in enumerate(self.levels):
+            if k == top:
+                assert node is not None
+                return (node if carry is None else _hash_node(node, carry)).hex()
+            if node is None:
+                if carry is not None:
+                    carry = _hash_node(carry, carry)
+            elif carry is None:
+                carry = _hash_node(node, node)
+            else:
+                carry = _hash_node(node, carry)
+        raise AssertionError("unreachable: top frontier level is always set")
+
+
+def _header_prefix_bytes(
+    index: int,
+    timestamp_utc: str,
+    previous_hash: str,
+    transaction_merkle_root: str,
+    compliance_data_hash: str,
+) -> bytes:
+    """Canonical JSON of the nonce-free header, written field by field.
+
+    Keys are emitted in sorted order so the bytes equal
+    ``canonical_serialize`` of the equivalent dict without building it.
+    """
+    return b"".join(
+        (
+            b'{"compliance_data_hash":',
+            _dumps(compliance_data_hash),
+            b',"index":',
+            _dumps(index),
+            b',"previous_hash":',
+            _dumps(previous_hash),
+            b',"timestamp_utc":',
+            _dumps(timestamp_utc),
+            b',"transaction_merkle_root":',
+            _dumps(transaction_merkle_root),
+            b"}",
+        )
+    )
+
+
+@lru_cache(maxsize=1024)
+def _header_hash_prefix(
+    index: int,
+    timestamp_utc: str,
+    previous_hash: str,
+    transaction_merkle_root: str,
+    compliance_data_hash: str,
+) -> Any:
+    """Return a SHA-256 state pre-seeded with the nonce-invariant header fields.
+
+    Callers must ``.copy()`` the returned object before updating it; the cache
+    is keyed on the field values, so a mutated header simply misses the cache.
+    """
+    return sha256(
+        _header_prefix_bytes(
+            index,
+            timestamp_utc,
+            previous_hash,
+            transaction_merkle_root,
+            compliance_data_hash,
+        )
+    )
 
 
 # -------------------------------
@@ -55,7 +325,15 @@ def merkle_root(transactions: List[Dict[str, Any]]) -> str:
 # -------------------------------
 
 
-@dataclass
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _to_epoch_us(ts: datetime) -> int:
+    return (ts - _EPOCH) // _ONE_US
+
+
+@dataclass(frozen=True)
 class AttestationPayload:
     device_id: str
     timestamp_utc: str
@@ -69,17 +347,52 @@ class AttestationPayload:
     signer: str
     signature: str
 
+    # Frozen, so the derived encodings below are computed at most once.
+    # No slots here: cached_property stores its results in __dict__.
+
+    @cached_property
+    def _fields(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @cached_property
+    def canonical_bytes(self) -> bytes:
+        return canonical_serialize(self._fields)
+
+    @cached_property
+    def _digest(self) -> str:
+        return sha256_hex(self.canonical_bytes)
+
+    @cached_property
+    def epoch_ns(self) -> Optional[int]:
+        """``timestamp_utc`` as Unix nanoseconds; None if unparseable or naive."""
+        try:
+            ts = datetime.fromisoformat(self.timestamp_utc)
+        except ValueError:
+            return None
+        if ts.tzinfo is None:
+            return None
+        return _to_epoch_us(ts) * 1000
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return a copy of the field dict; all fields are scalars."""
+        return dict(self._fields)
+
     def digest(self) -> str:
-        return sha256_hex(canonical_serialize(asdict(self)).encode("utf-8"))
+        return self._digest
 
 
-@dataclass
+@dataclass(slots=True)
 class ComplianceResult:
     ok: bool
     reason_code: str
     evidence: Dict[str, Any]
 
 
+def compliance_hash(data: Dict[str, Any]) -> str:
+    """Digest of compliance evidence, bound into the block header."""
+    return sha256_hex(canonical_serialize(data))
+
+
 class ComplianceChecker(ABC):
     """Interface to support different attestation/verification backends."""
 
@@ -98,16 +411,17 @@ def verify_attestation_payload(
 
     This is a lightweight stand-in for real cryptographic signature validation.
     """
-    now_utc = now_utc or datetime.now(timezone.utc)
-    try:
-        payload_time = datetime.fromisoformat(payload.timestamp_utc)
-    except ValueError:
-        return False, "INVALID_TIMESTAMP_FORMAT"
-
-    if payload_time.tzinfo is None:
+    payload_ns = payload.epoch_ns
+    if payload_ns is None:
+        # Slow path only for bad input: re-parse to pick the reason code.
+        try:
+            datetime.fromisoformat(payload.timestamp_utc)
+        except ValueError:
+            return False, "INVALID_TIMESTAMP_FORMAT"
         return False, "TIMESTAMP_MISSING_TIMEZONE"
 
-    if now_utc - payload_time > timedelta(minutes=max_age_minutes):
+    now_ns = time.time_ns() if now_utc is None else _to_epoch_us(now_utc) * 1000
+    if now_ns - payload_ns > max_age_minutes * 60_000_000_000:
         return False, "STALE_ATTESTATION"
 
     if not payload.signature or not payload.signer:
@@ -133,10 +447,11 @@ class DemoComplianceChecker(ComplianceChecker):
         self.allowed_lux_min = allowed_lux_min
         self.max_attestation_age_minutes = max_attestation_age_minutes
 
-    def perform_check(self) -> ComplianceResult:
+    def perform_check(self, *, now_utc: Optional[datetime] = None) -> ComplianceResult:
+        now_utc = now_utc or datetime.now(timezone.utc)
         payload = AttestationPayload(
             device_id="node-device-001",
-            timestamp_utc=datetime.now(timezone.utc).isoformat(),
+            timestamp_utc=now_utc.isoformat(),
             latitude=49.2827,
             longitude=-123.1207,
             compass_orientation=270,
@@ -150,23 +465,24 @@ class DemoComplianceChecker(ComplianceChecker):
 
         valid, reason = verify_attestation_payload(
             payload,
+            now_utc=now_utc,
             max_age_minutes=self.max_attestation_age_minutes,
         )
         if not valid:
-            return ComplianceResult(False, reason, {"attestation": asdict(payload)})
+            return ComplianceResult(False, reason, {"attestation": payload.as_dict()})
 
         # Mock policy checks. In production, signature and quote verification
         # should happen against trusted roots + hardware attestation APIs.
         if payload.uv_index > self.allowed_uv_max:
-            return ComplianceResult(False, "UV_LIMIT_EXCEEDED", {"attestation": asdict(payload)})
+            return ComplianceResult(False, "UV_LIMIT_EXCEEDED", {"attestation": payload.as_dict()})
         if payload.ambient_lux < self.allowed_lux_min:
-            return ComplianceResult(False, "LOW_LIGHT_ENVIRONMENT", {"attestation": asdict(payload)})
+            return ComplianceResult(False, "LOW_LIGHT_ENVIRONMENT", {"attestation": payload.as_dict()})
 
         return ComplianceResult(
             True,
             "COMPLIANT",
             {
-                "attestation": asdict(payload),
+                "attestation": payload.as_dict(),
                 "attestation_digest": payload.digest(),
             },
         )
@@ -177,7 +493,7 @@ class DemoComplianceChecker(ComplianceChecker):
 # -------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class BlockHeader:
     index: int
     timestamp_utc: str
@@ -186,21 +502,46 @@ class BlockHeader:
     compliance_data_hash: str
     nonce: int = 0
 
+    def canonical_bytes(self) -> bytes:
+        """Exact bytes hashed for this header: nonce-free canonical JSON, then the nonce."""
+        prefix = _header_prefix_bytes(
+            self.index,
+            self.timestamp_utc,
+            self.previous_hash,
+            self.transaction_merkle_root,
+            self.compliance_data_hash,
+        )
+        return prefix + str(self.nonce).encode("ascii")
+
 
-@dataclass
+@dataclass(slots=True)
 class Block:
+    """A header plus its transactions; ``block_hash`` stays empty until sealed."""
+
     header: BlockHeader
     transactions: List[Dict[str, Any]]
-    block_hash: str = field(init=False)
+    block_hash: str = ""
 
-    def __post_init__(self) -> None:
+    def seal(self, prev_hash: str) -> None:
+        """Link the block to ``prev_hash`` and compute its hash exactly once."""
+        self.header.previous_hash = prev_hash
         self.block_hash = self.calculate_hash()
 
     def calculate_hash(self) -> str:
-        return sha256_hex(canonical_serialize(asdict(self.header)).encode("utf-8"))
-
-
-@dataclass
+        """Hash the canonical nonce-free header followed by the decimal nonce."""
+        header = self.header
+        h = _header_hash_prefix(
+            header.index,
+            header.timestamp_utc,
+            header.previous_hash,
+            header.transaction_merkle_root,
+            header.compliance_data_hash,
+        ).copy()
+        h.update(str(header.nonce).encode("ascii"))
+        return h.hexdigest()
+
+
+@dataclass(slots=True)
 class EscrowRecord:
     notary: str
     liquid_amount: int
@@ -210,54 +551,132 @@ class EscrowRecord:
     is_slashed: bool = False
 
 
+ESCROW_LOCK_PERIOD = timedelta(days=365 * 5)
+
+
 class HonestyEscrow:
-    """75/25 split: 25% immediate, 75% locked for 5 years."""
+    """75/25 split: 25% immediate, 75% locked for 5 years.
+
+    Records are stored column-wise (one packed ``array`` per field, sorted by
+    block height) rather than as one dataclass per block, so a long chain
+    costs a few machine words per escrow and sweeps scan contiguous memory.
+    ``EscrowRecord`` instances are materialized snapshots; mutate state only
+    through the methods below.
+    """
 
     def __init__(self) -> None:
-        self.records: Dict[int, EscrowRecord] = {}
+        self._heights = array("q")
+        self._notaries: List[str] = []
+        self._liquid = array("q")
+        self._escrow = array("q")
+        self._release_us = array("q")
+        self._slashed = bytearray()
+
+    def __len__(self) -> int:
+        return len(self._heights)
+
+    def _row(self, block_height: int) -> int:
+        row = bisect_left(self._heights, block_height)
+        if row == len(self._heights) or self._heights[row] != block_height:
+            raise KeyError(block_height)
+        return row
+
+    def get_record(self, block_height: int) -> EscrowRecord:
+        row = self._row(block_height)
+        return EscrowRecord(
+            notary=self._notaries[row],
+            liquid_amount=self._liquid[row],
+            escrow_amount=self._escrow[row],
+            block_height=block_height,
+            release_timestamp_utc=_EPOCH + timedelta(microseconds=self._release_us[row]),
+            is_slashed=bool(self._slashed[row]),
+        )
 
-    def create_escrow(self, *, notary: str, reward_amount: int, block_height: int) -> EscrowRecord:
+    def create_escrow(
+        self,
+        *,
+        notary: str,
+        reward_amount: int,
+        block_height: int,
+        now_utc: Optional[datetime] = None,
+    ) -> EscrowRecord:
         if reward_amount <= 0:
             raise ValueError("Reward amount must be positive")
 
         liquid = reward_amount * 25 // 100
         escrow = reward_amount - liquid
-        record = EscrowRecord(
-            notary=notary,
-            liquid_amount=liquid,
-            escrow_amount=escrow,
-            block_height=block_height,
-            release_timestamp_utc=datetime.now(timezone.utc) + timedelta(days=365 * 5),
-        )
-        self.records[block_height] = record
-        return record
+        release_us = _to_epoch_us((now_utc or datetime.now(timezone.utc)) + ESCROW_LOCK_PERIOD)
+
+        # Heights normally arrive in increasing order, making this an append.
+        row = bisect_left(self._heights, block_height)
+        if row < len(self._heights) and self._heights[row] == block_height:
+            self._notaries[row] = notary
+            self._liquid[row] = liquid
+            self._escrow[row] = escrow
+            self._release_us[row] = release_us
+            self._slashed[row] = 0
+        else:
+            self._heights.insert(row, block_height)
+            self._notaries.insert(row, notary)
+            self._liquid.insert(row, liquid)
+            self._escrow.insert(row, escrow)
+            self._release_us.insert(row, release_us)
+            self._slashed.insert(row, 0)
+        return self.get_record(block_height)
 
     def slash_and_reimburse(self, *, block_height: int, victim: str) -> Tuple[int, str]:
-        record = self.records[block_height]
-        if record.is_slashed:
+        row = self._row(block_height)
+        if self._slashed[row]:
             raise ValueError("Escrow already slashed")
-        record.is_slashed = True
-        slashed = record.escrow_amount
-        record.escrow_amount = 0
+        self._slashed[row] = 1
+        slashed = self._escrow[row]
+        self._escrow[row] = 0
         return slashed, victim
 
     def release_funds(self, *, block_height: int, caller: str, now_utc: Optional[datetime] = None) -> int:
-        record = self.records[block_height]
+        row = self._row(block_height)
         now_utc = now_utc or datetime.now(timezone.utc)
-        if caller != record.notary:
+        if caller != self._notaries[row]:
             raise PermissionError("Caller is not escrow owner")
-        if record.is_slashed:
+        if self._slashed[row]:
             raise ValueError("Escrow was slashed")
-        if now_utc < record.release_timestamp_utc:
+        if _to_epoch_us(now_utc) < self._release_us[row]:
             raise ValueError("Escrow period not complete")
-        amount = record.escrow_amount
-        record.escrow_amount = 0
+        amount = self._escrow[row]
+        self._escrow[row] = 0
         return amount
 
+    def matured_heights(self, *, now_utc: Optional[datetime] = None) -> List[int]:
+        """Block heights whose unslashed, non-empty escrow can be released now."""
+        now_us = _to_epoch_us(now_utc or datetime.now(timezone.utc))
+        release_us, slashed, escrow = self._release_us, self._slashed, self._escrow
+        return [
+            height
+            for row, height in enumerate(self._heights)
+            if release_us[row] <= now_us and not slashed[row] and escrow[row]
+        ]
+
+
+# Floor for the opt-in process pool. Shipping blocks to workers is not free:
+# pickling a 5000-block chain takes ~44 ms against ~37 ms to validate it
+# serially, so the pool only pays off with several idle cores.
+PARALLEL_VALIDATION_MIN_BLOCKS = 4096
+
+
+def _validate_block(block: Block) -> Optional[str]:
+    """Return the failure prefix for a block's own hashes, or None if intact."""
+    if block.block_hash != block.calculate_hash():
+        return "HASH_MISMATCH"
+    if block.header.transaction_merkle_root != merkle_root(block.transactions):
+        return "MERKLE_MISMATCH"
+    return None
+
 
 class Blockchain:
     def __init__(self) -> None:
         self.chain: List[Block] = [self.create_genesis_block()]
+        self._pending: List[bytes] = []
+        self.merkle = IncrementalMerkle()
 
     def create_genesis_block(self) -> Block:
         txs = [{"type": "genesis"}]
@@ -269,44 +688,96 @@ class Blockchain:
             compliance_data_hash="0",
             nonce=0,
         )
-        return Block(header=header, transactions=txs)
+        genesis = Block(header=header, transactions=txs)
+        genesis.seal("0")
+        return genesis
 
     def get_latest_block(self) -> Block:
         return self.chain[-1]
 
+    @property
+    def pending_transactions(self) -> List[Dict[str, Any]]:
+        """Fresh copies of the queued transactions, decoded from what was hashed."""
+        return [json.loads(canon) for canon in self._pending]
+
+    def add_transaction(self, tx: Dict[str, Any]) -> None:
+        """Queue a transaction for the next block, folding it into the Merkle frontier.
+
+        The canonical encoding is captured here, so later edits to ``tx``
+        cannot make the mined block disagree with the accumulated root.
+        """
+        canon = canonical_serialize(tx)
+        self._pending.append(canon)
+        self.merkle.append(_leaf_hash_cached(canon))
+
+    def clear_pending(self) -> None:
+        self._pending = []
+        self.merkle = IncrementalMerkle()
+
     def add_block(self, block: Block) -> Block:
+        """Verify and append ``block``, sealing it onto the current tip.
+
+        An unsealed block may leave ``previous_hash`` empty; a block that was
+        already sealed elsewhere has its hash verified instead of trusted.
+        """
         expected_prev = self.get_latest_block().block_hash
-        if block.header.previous_hash != expected_prev:
+        unsealed = not block.block_hash and not block.header.previous_hash
+        if not unsealed and block.header.previous_hash != expected_prev:
             raise ValueError("previous_hash mismatch")
 
         expected_merkle = merkle_root(block.transactions)
         if block.header.transaction_merkle_root != expected_merkle:
             raise ValueError("transaction_merkle_root mismatch")
 
-        recomputed = block.calculate_hash()
-        if block.block_hash != recomputed:
+        if block.block_hash and block.block_hash != block.calculate_hash():
             raise ValueError("block hash mismatch")
 
+        return self._append(block)
+
+    def _append(self, block: Block) -> Block:
+        """Seal ``block`` onto the tip if it is unsealed and append it unverified.
+
+        Only for blocks built from this chain's own pending queue, whose
+        Merkle root comes from ``self.merkle`` rather than caller input.
+        """
+        if not block.block_hash:
+            block.seal(self.get_latest_block().block_hash)
         self.chain.append(block)
         return block
 
-    def validate_chain(self) -> Tuple[bool, str]:
-        """Validate every block linkage and hash in the current chain."""
+    def validate_chain(self, *, workers: int = 1) -> Tuple[bool, str]:
+        """Validate every block linkage and hash in the current chain.
+
+        Merkle roots are re-derived from the stored transactions on purpose:
+        comparing against a cached root would miss tampered transaction lists.
+
+        Per-block hash/Merkle checks are independent; passing ``workers > 1``
+        fans them out to a process pool for chains of at least
+        ``PARALLEL_VALIDATION_MIN_BLOCKS`` blocks. Serial is the default
+        because pickling the chain costs about as much as validating it.
+        Linkage is checked in one serial pass afterwards, so the first
+        reported failure is the same either way.
+        """
         if not self.chain:
             return False, "EMPTY_CHAIN"
 
-        for index, block in enumerate(self.chain):
-            if block.block_hash != block.calculate_hash():
-                return False, f"HASH_MISMATCH_AT_{index}"
+        if workers > 1 and len(self.chain) >= PARALLEL_VALIDATION_MIN_BLOCKS:
+            # spawn, not fork: the Numba Merkle kernel may already have started
+            # worker threads, and forking a threaded process can deadlock.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+                failures: Iterable[Optional[str]] = list(pool.map(_validate_block, self.chain, chunksize=64))
+        else:
+            failures = map(_validate_block, self.chain)
 
-            if block.header.transaction_merkle_root != merkle_root(block.transactions):
-                return False, f"MERKLE_MISMATCH_AT_{index}"
+        for index, failure in enumerate(failures):
+            if failure is not None:
+                return False, f"{failure}_AT_{index}"
 
             if index == 0:
                 continue
 
-            prev = self.chain[index - 1]
-            if block.header.previous_hash != prev.block_hash:
+            if self.chain[index].header.previous_hash != self.chain[index - 1].block_hash:
                 return False, f"LINK_MISMATCH_AT_{index}"
 
         return True, "CHAIN_VALID"
@@ -319,24 +790,49 @@ class Blockchain:
 
 def mine_compliant_block(
     chain: Blockchain,
-    transactions: List[Dict[str, Any]],
+    transactions: Optional[List[Dict[str, Any]]] = None,
     checker: Optional[ComplianceChecker] = None,
+    *,
+    now_utc: Optional[datetime] = None,
 ) -> Block:
-    checker = checker or DemoComplianceChecker()
-    result = checker.perform_check()
+    """Mine a block after a passing compliance check.
+
+    When ``transactions`` is omitted the chain's pending queue is sealed,
+    reusing the root its incremental Merkle accumulator already built; the
+    block skips ``add_block``'s from-scratch Merkle check, which is safe
+    because the queue holds the exact bytes that were folded into it.
+    The clock is read once: the header timestamp and, when no ``checker`` is
+    given, the default checker's attestation both use ``now_utc`` (or that
+    single reading). Callers mining in a loop can pin ``now_utc`` instead of
+    paying for a fresh reading per block.
+    """
+    now = now_utc or datetime.now(timezone.utc)
+    if checker is None:
+        result = DemoComplianceChecker().perform_check(now_utc=now)
+    else:
+        result = checker.perform_check()
     if not result.ok:
         raise RuntimeError(f"Compliance check failed: {result.reason_code}")
 
-    latest = chain.get_latest_block()
+    if transactions is None:
+        txs, tx_root, from_pending = chain.pending_transactions, chain.merkle.root(), True
+    else:
+        txs, tx_root, from_pending = transactions, merkle_root(transactions), False
+
     header = BlockHeader(
         index=len(chain.chain),
-        timestamp_utc=datetime.now(timezone.utc).isoformat(),
-        previous_hash=latest.block_hash,
-        transaction_merkle_root=merkle_root(transactions),
-        compliance_data_hash=sha256_hex(canonical_serialize(result.evidence).encode("utf-8")),
+        timestamp_utc=now.isoformat(),
+        previous_hash="",
+        transaction_merkle_root=tx_root,
+        compliance_data_hash=compliance_hash(result.evidence),
         nonce=0,
     )
-    return chain.add_block(Block(header=header, transactions=transactions))
+    block = Block(header=header, transactions=txs)
+    if from_pending:
+        chain._append(block)
+        chain.clear_pending()
+        return block
+    return chain.add_block(block)
 
 
 if __name__ == "__main__":
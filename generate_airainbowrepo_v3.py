@@ -11,6 +11,10 @@ DATE_STR = "2026-02-10"
 REPO_NAME = f"AiRainbowRepo_{DATE_STR}_{PROJECT_ID}_{VERSION}"
 BASE_DIR = "AiRainbowRepo/"
 
+# Members smaller than this are stored: deflate saves almost nothing on
+# short text but still costs a compressor setup per entry.
+STORE_BELOW_BYTES = 512
+
 FOLDERS = [
     "docs",
     "code/backend",
@@ -89,9 +93,11 @@ def build_zip() -> Path:
     out = Path(f"{REPO_NAME}.zip")
     with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED) as zf:
         for folder in FOLDERS:
-            zf.writestr(f"{BASE_DIR}{folder}/.gitkeep", "")
+            zf.writestr(f"{BASE_DIR}{folder}/.gitkeep", "", compress_type=zipfile.ZIP_STORED)
         for rel, content in FILES.items():
-            zf.writestr(f"{BASE_DIR}{rel}", content)
+            data = content.encode("utf-8")
+            ctype = zipfile.ZIP_STORED if len(data) < STORE_BELOW_BYTES else zipfile.ZIP_DEFLATED
+            zf.writestr(f"{BASE_DIR}{rel}", data, compress_type=ctype)
     return out
 
 
@@ -0,0 +1,32 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled Merkle level reduction for ``blockchain_compliance_protocol``.
+
+Optional extension; ``merkle_root`` falls back to its pure-Python loop when
+this module is not built. Build in place with::
+
+    cythonize -i merkle_core.pyx
+
+Hashing still goes through hashlib (OpenSSL releases the GIL for large
+inputs); only the per-pair loop and slicing move to C.
+"""
+
+from hashlib import sha256
+
+
+def merkle_root_bytes(bytes level):
+    """Reduce a flat buffer of 32-byte leaf digests to the 32-byte root.
+
+    An odd node at the end of a level is paired with itself, matching
+    ``merkle_root``.
+    """
+    cdef Py_ssize_t n, i
+    cdef list parents
+    while len(level) > 32:
+        if len(level) % 64:
+            level = level + level[-32:]
+        n = len(level)
+        parents = []
+        for i in range(0, n, 64):
+            parents.append(sha256(level[i:i + 64]).digest())
+        level = b"".join(parents)
+    return level
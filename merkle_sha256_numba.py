@@ -0,0 +1,130 @@
+"""Numba SHA-256 kernel for hashing Merkle sibling pairs in bulk.
+
+Optional accelerator for ``blockchain_compliance_protocol.merkle_root`` on
+hosts without a SHA-NI/AVX2 multi-buffer backend. Every internal node hashes
+exactly 64 bytes (``left || right``), so the padding block is constant and its
+message schedule is a precomputed table. Compiled kernels are cached on disk
+(``cache=True``) to avoid paying the JIT cost on every process start.
+
+Requires ``numpy`` and ``numba``; importing this module raises ImportError
+when either is missing, which callers treat as "backend unavailable".
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+_MASK = np.uint64(0xFFFFFFFF)
+
+_K = np.array(
+    [
+        0x428A2F98, 0x71374491, 0xB5C0FBCF, 0xE9B5DBA5, 0x3956C25B, 0x59F111F1, 0x923F82A4, 0xAB1C5ED5,
+        0xD807AA98, 0x12835B01, 0x243185BE, 0x550C7DC3, 0x72BE5D74, 0x80DEB1FE, 0x9BDC06A7, 0xC19BF174,
+        0xE49B69C1, 0xEFBE4786, 0x0FC19DC6, 0x240CA1CC, 0x2DE92C6F, 0x4A7484AA, 0x5CB0A9DC, 0x76F988DA,
+        0x983E5152, 0xA831C66D, 0xB00327C8, 0xBF597FC7, 0xC6E00BF3, 0xD5A79147, 0x06CA6351, 0x14292967,
+        0x27B70A85, 0x2E1B2138, 0x4D2C6DFC, 0x53380D13, 0x650A7354, 0x766A0ABB, 0x81C2C92E, 0x92722C85,
+        0xA2BFE8A1, 0xA81A664B, 0xC24B8B70, 0xC76C51A3, 0xD192E819, 0xD6990624, 0xF40E3585, 0x106AA070,
+        0x19A4C116, 0x1E376C08, 0x2748774C, 0x34B0BCB5, 0x391C0CB3, 0x4ED8AA4A, 0x5B9CCA4F, 0x682E6FF3,
+        0x748F82EE, 0x78A5636F, 0x84C87814, 0x8CC70208, 0x90BEFFFA, 0xA4506CEB, 0xBEF9A3F7, 0xC67178F2,
+    ],
+    dtype=np.uint64,
+)
+
+_H0 = np.array(
+    [0x6A09E667, 0xBB67AE85, 0x3C6EF372, 0xA54FF53A, 0x510E527F, 0x9B05688C, 0x1F83D9AB, 0x5BE0CD19],
+    dtype=np.uint64,
+)
+
+
+@njit(inline="always", cache=True)
+def _rotr(x, n):
+    n = np.uint64(n)
+    return ((x >> n) | (x << (np.uint64(32) - n))) & _MASK
+
+
+@njit(cache=True)
+def _expand(w):
+    for t in range(16, 64):
+        s0 = _rotr(w[t - 15], 7) ^ _rotr(w[t - 15], 18) ^ (w[t - 15] >> np.uint64(3))
+        s1 = _rotr(w[t - 2], 17) ^ _rotr(w[t - 2], 19) ^ (w[t - 2] >> np.uint64(10))
+        w[t] = (w[t - 16] + s0 + w[t - 7] + s1) & _MASK
+
+
+@njit(cache=True)
+def _compress(state, w):
+    a, b, c, d = state[0], state[1], state[2], state[3]
+    e, f, g, h = state[4], state[5], state[6], state[7]
+    for t in range(64):
+        s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+        ch = (e & f) ^ (~e & g & _MASK)
+        t1 = (h + s1 + ch + _K[t] + w[t]) & _MASK
+        s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        t2 = (s0 + maj) & _MASK
+        h = g
+        g = f
+        f = e
+        e = (d + t1) & _MASK
+        d = c
+        c = b
+        b = a
+        a = (t1 + t2) & _MASK
+    state[0] = (state[0] + a) & _MASK
+    state[1] = (state[1] + b) & _MASK
+    state[2] = (state[2] + c) & _MASK
+    state[3] = (state[3] + d) & _MASK
+    state[4] = (state[4] + e) & _MASK
+    state[5] = (state[5] + f) & _MASK
+    state[6] = (state[6] + g) & _MASK
+    state[7] = (state[7] + h) & _MASK
+
+
+# Message schedule of the second block of every 64-byte message: the 0x80
+# marker, zeros, then the 512-bit length, expanded to 64 words. Written out
+# rather than computed so importing this module does not JIT ``_expand``.
+_PAD_W = np.array(
+    [
+        0x80000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000,
+        0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000000, 0x00000200,
+        0x80000000, 0x01400000, 0x00205000, 0x00005088, 0x22000800, 0x22550014, 0x05089742, 0xA0000020,
+        0x5A880000, 0x005C9400, 0x0016D49D, 0xFA801F00, 0xD33225D0, 0x11675959, 0xF6E6BFDA, 0xB30C1549,
+        0x08B2B050, 0x9D7C4C27, 0x0CE2A393, 0x88E6E1EA, 0xA52B4335, 0x67A16F49, 0xD732016F, 0x4EEB2E91,
+        0x5DBF55E5, 0x8EEE2335, 0xE2BC5EC2, 0xA83F4394, 0x45AD78F7, 0x36F3D0CD, 0xD99C05E8, 0xB0511DC7,
+        0x69BC7AC4, 0xBD11375B, 0xE3BA71E5, 0x3B209FF2, 0x18FEEE17, 0xE25AD9E7, 0x13375046, 0x0515089D,
+        0x4F0D0F04, 0x2627484E, 0x310128D2, 0xC668B434, 0x420841CC, 0x62D311B8, 0xE59BA771, 0x85A7A484,
+    ],
+    dtype=np.uint64,
+)
+
+
+@njit(cache=True, parallel=True)
+def hash_pairs(buf_in, buf_out):
+    """SHA-256 each row of ``buf_in`` (uint8[n, 64]) into ``buf_out`` (uint8[n, 32])."""
+    for i in prange(buf_in.shape[0]):
+        w = np.empty(64, dtype=np.uint64)
+        for j in range(16):
+            w[j] = (
+                (np.uint64(buf_in[i, 4 * j]) << np.uint64(24))
+                | (np.uint64(buf_in[i, 4 * j + 1]) << np.uint64(16))
+                | (np.uint64(buf_in[i, 4 * j + 2]) << np.uint64(8))
+                | np.uint64(buf_in[i, 4 * j + 3])
+            )
+        _expand(w)
+        state = _H0.copy()
+        _compress(state, w)
+        _compress(state, _PAD_W)
+        for j in range(8):
+            word = state[j]
+            buf_out[i, 4 * j] = np.uint8(word >> np.uint64(24))
+            buf_out[i, 4 * j + 1] = np.uint8((word >> np.uint64(16)) & np.uint64(0xFF))
+            buf_out[i, 4 * j + 2] = np.uint8((word >> np.uint64(8)) & np.uint64(0xFF))
+            buf_out[i, 4 * j + 3] = np.uint8(word & np.uint64(0xFF))
+
+
+def hash_pairs_bytes(buf: bytes) -> bytes:
+    """Bytes-in/bytes-out wrapper matching the ``merkle_root`` level reducer."""
+    src = np.frombuffer(buf, dtype=np.uint8).reshape(-1, 64)
+    out = np.empty((src.shape[0], 32), dtype=np.uint8)
+    hash_pairs(src, out)
+    return out.tobytes()
@@ -6,8 +6,17 @@ Defensive, deterministic reference implementation for Rainbow Jobs OneCode.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from hashlib import sha256
-from typing import Dict, List
+from functools import lru_cache
+from hashlib import blake2s
+from typing import Dict, List, Optional, Sequence
+
+_ACTIONS = ["redefines", "connects", "illuminates"]
+
+
+@lru_cache(maxsize=1024)
+def _digest4(seed: str) -> int:
+    """Deterministic 32-bit index seed; blake2s setup is cheaper than sha256."""
+    return int.from_bytes(blake2s(seed.encode("utf-8"), digest_size=4).digest(), "big")
 
 
 @dataclass
@@ -31,6 +40,27 @@ class RainbowJobsOneCode:
 
         Uses hashing for reproducibility (instead of random choice).
         """
+        return self._synthesize(prompt, creativity, self.kb["finance"] + self.kb["tech"])
+
+    def resonance_synthesis_batch(
+        self,
+        prompts: Sequence[str],
+        creativities: Optional[Sequence[float]] = None,
+    ) -> List[str]:
+        """Batch form of ``resonance_synthesis``; same output per prompt.
+
+        The knowledge-bridge object list is built once for the whole batch,
+        and repeated (prompt, creativity) seeds reuse cached digests.
+        """
+        if creativities is None:
+            creativities = [0.7] * len(prompts)
+        elif len(creativities) != len(prompts):
+            raise ValueError("prompts and creativities must have the same length")
+
+        objects = self.kb["finance"] + self.kb["tech"]
+        return [self._synthesize(p, c, objects) for p, c in zip(prompts, creativities)]
+
+    def _synthesize(self, prompt: str, creativity: float, objects: List[str]) -> str:
         words = [w.strip(".,:;!?").lower() for w in prompt.split() if w.strip()]
         concepts = words[:]
 
@@ -42,8 +72,8 @@ class RainbowJobsOneCode:
             concepts = ["onecode"]
 
         subject = self._pick(concepts, f"subject:{prompt}:{creativity}")
-        action = self._pick(["redefines", "connects", "illuminates"], f"action:{prompt}:{creativity}")
-        obj = self._pick(self.kb["finance"] + self.kb["tech"], f"object:{prompt}:{creativity}")
+        action = self._pick(_ACTIONS, f"action:{prompt}:{creativity}")
+        obj = self._pick(objects, f"object:{prompt}:{creativity}")
 
         insight = f"The concept of '{subject}' {action} the architecture of {obj}."
         return self._apply_watermark(insight)
@@ -81,9 +111,7 @@ Compliance-Gated Mining Blueprint:
         return self._apply_watermark(summary)
 
     def _pick(self, options: List[str], seed: str) -> str:
-        digest = sha256(seed.encode("utf-8")).hexdigest()
-        idx = int(digest[:8], 16) % len(options)
-        return options[idx]
+        return options[_digest4(seed) % len(options)]
 
     def _apply_watermark(self, content: str) -> str:
         return f"{content}\n\n--- Watermark: {self.watermark} ---"
@@ -6,9 +6,52 @@ It helps validate detection rules for inconsistent telemetry.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Tuple
+from enum import IntEnum
+from typing import Any, Callable, Dict, Sequence, Tuple
+
+try:  # Optional: only the batched (struct-of-arrays) paths need numpy.
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on local environment
+    np = None
+
+try:  # Optional fused kernel for reason_codes; numpy ufuncs otherwise.
+    from telemetry_numba import reason_codes as _numba_reason_codes
+except ImportError:  # pragma: no cover - depends on local environment
+    _numba_reason_codes = None
+
+
+class Reason(IntEnum):
+    """Verification outcome; values double as the int8 batch reason codes."""
+
+    COMPLIANT = 0
+    GPS_DRIFT_EXCEEDED = 1
+    STALE_TELEMETRY = 2
+
+
+# Bits of the per-row failure mask from CompliancePolicy.failure_flags.
+FLAG_LAT_DRIFT = 1
+FLAG_LON_DRIFT = 2
+FLAG_STALE = 4
+
+# First failing reason for each of the 8 flag combinations; drift wins over
+# staleness, matching the short-circuit order of CompliancePolicy.verify.
+REASON_TABLE = (
+    Reason.COMPLIANT,
+    Reason.GPS_DRIFT_EXCEEDED,
+    Reason.GPS_DRIFT_EXCEEDED,
+    Reason.GPS_DRIFT_EXCEEDED,
+    Reason.STALE_TELEMETRY,
+    Reason.GPS_DRIFT_EXCEEDED,
+    Reason.GPS_DRIFT_EXCEEDED,
+    Reason.GPS_DRIFT_EXCEEDED,
+)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_SPOOFED_DELTA = (0.03, -0.04)
+_REPLAY_OFFSET_NS = 25 * 60_000_000_000
 
 
 @dataclass
@@ -18,10 +61,63 @@ class Telemetry:
     uv_index: int
     ambient_lux: int
     compass_orientation: int
-    timestamp_utc: datetime
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp_utc(self) -> datetime:
+        """``timestamp_ns`` as an aware datetime, built only when asked for."""
+        return _EPOCH + timedelta(microseconds=self.timestamp_ns // 1000)
+
+
+@dataclass
+class TelemetryBatch:
+    """Struct-of-arrays telemetry for sweeping many scenarios at once.
+
+    Each column is a numpy array with one entry per scenario; timestamps are
+    UTC nanoseconds since the epoch. Spoofers return new batches that share
+    every column they did not change, so treat batches as read-only.
+    """
+
+    lat: Any
+    lon: Any
+    uv: Any
+    lux: Any
+    compass: Any
+    ts_ns: Any
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Telemetry]) -> TelemetryBatch:
+        if np is None:
+            raise ImportError("TelemetryBatch requires numpy")
+        return cls(
+            lat=np.array([t.latitude for t in rows], dtype=np.float64),
+            lon=np.array([t.longitude for t in rows], dtype=np.float64),
+            uv=np.array([t.uv_index for t in rows], dtype=np.int32),
+            lux=np.array([t.ambient_lux for t in rows], dtype=np.int32),
+            compass=np.array([t.compass_orientation for t in rows], dtype=np.int16),
+            ts_ns=np.array([t.timestamp_ns for t in rows], dtype=np.int64),
+        )
+
+    def __len__(self) -> int:
+        return len(self.lat)
+
+    def row(self, i: int) -> Telemetry:
+        """Materialize one scenario as a scalar ``Telemetry`` for legacy callers."""
+        return Telemetry(
+            latitude=float(self.lat[i]),
+            longitude=float(self.lon[i]),
+            uv_index=int(self.uv[i]),
+            ambient_lux=int(self.lux[i]),
+            compass_orientation=int(self.compass[i]),
+            timestamp_ns=int(self.ts_ns[i]),
+        )
 
 
 class TrustedOracle:
+    def __init__(self, clock: Callable[[], int] = time.time_ns) -> None:
+        """``clock`` returns UTC epoch nanoseconds; inject a fake one for deterministic runs."""
+        self._clock = clock
+
     def read(self) -> Telemetry:
         return Telemetry(
             latitude=49.2827,
@@ -29,21 +125,24 @@ class TrustedOracle:
             uv_index=6,
             ambient_lux=45000,
             compass_orientation=270,
-            timestamp_utc=datetime.now(timezone.utc),
+            timestamp_ns=self._clock(),
         )
 
 
 class FakeGPSSpoofer:
     def apply(self, t: Telemetry) -> Telemetry:
         return Telemetry(
-            latitude=t.latitude + 0.03,
-            longitude=t.longitude - 0.04,
+            latitude=t.latitude + _SPOOFED_DELTA[0],
+            longitude=t.longitude + _SPOOFED_DELTA[1],
             uv_index=t.uv_index,
             ambient_lux=t.ambient_lux,
             compass_orientation=t.compass_orientation,
-            timestamp_utc=t.timestamp_utc,
+            timestamp_ns=t.timestamp_ns,
         )
 
+    def apply_batch(self, batch: TelemetryBatch) -> TelemetryBatch:
+        return replace(batch, lat=batch.lat + _SPOOFED_DELTA[0], lon=batch.lon + _SPOOFED_DELTA[1])
+
 
 class SensorReplay:
     def apply(self, t: Telemetry) -> Telemetry:
@@ -53,41 +152,81 @@ class SensorReplay:
             uv_index=t.uv_index,
             ambient_lux=t.ambient_lux,
             compass_orientation=t.compass_orientation,
-            timestamp_utc=t.timestamp_utc - timedelta(minutes=25),
+            timestamp_ns=t.timestamp_ns - _REPLAY_OFFSET_NS,
         )
 
+    def apply_batch(self, batch: TelemetryBatch) -> TelemetryBatch:
+        return replace(batch, ts_ns=batch.ts_ns - np.int64(_REPLAY_OFFSET_NS))
+
 
 class CompliancePolicy:
     def __init__(self, max_position_drift_deg: float = 0.01, max_age_minutes: int = 5) -> None:
         self.max_position_drift_deg = max_position_drift_deg
         self.max_age_minutes = max_age_minutes
+        self._max_age_ns = max_age_minutes * 60_000_000_000
 
-    def verify(self, observed: Telemetry, oracle: Telemetry) -> Tuple[bool, str]:
+    def verify(self, observed: Telemetry, oracle: Telemetry) -> Tuple[bool, Reason]:
         if abs(observed.latitude - oracle.latitude) > self.max_position_drift_deg:
-            return False, "GPS_DRIFT_EXCEEDED"
+            return False, Reason.GPS_DRIFT_EXCEEDED
         if abs(observed.longitude - oracle.longitude) > self.max_position_drift_deg:
-            return False, "GPS_DRIFT_EXCEEDED"
-
-        age = oracle.timestamp_utc - observed.timestamp_utc
-        if age > timedelta(minutes=self.max_age_minutes):
-            return False, "STALE_TELEMETRY"
-
-        return True, "COMPLIANT"
+            return False, Reason.GPS_DRIFT_EXCEEDED
+
+        if oracle.timestamp_ns - observed.timestamp_ns > self._max_age_ns:
+            return False, Reason.STALE_TELEMETRY
+
+        return True, Reason.COMPLIANT
+
+    def reason_codes(self, observed: TelemetryBatch, oracle: TelemetryBatch) -> Any:
+        """int8 ``Reason`` code per row, with the same precedence as ``verify``.
+
+        ``oracle`` may be a full batch or a single row broadcast to all rows.
+        """
+        if _numba_reason_codes is not None:
+            return _numba_reason_codes(
+                observed.lat,
+                observed.lon,
+                observed.ts_ns,
+                oracle.lat,
+                oracle.lon,
+                oracle.ts_ns,
+                self.max_position_drift_deg,
+                self._max_age_ns,
+            )
+        return np.array(REASON_TABLE, dtype=np.int8)[self.failure_flags(observed, oracle)]
+
+    def failure_flags(self, observed: TelemetryBatch, oracle: TelemetryBatch) -> Any:
+        """uint8 bitmask per row of every failed check (``FLAG_*``), computed branch-free.
+
+        Unlike the reason code this keeps all failures, e.g. a replayed and
+        spoofed row reports both drift and staleness.
+        """
+        drift = self.max_position_drift_deg
+        lat_bad = (np.abs(observed.lat - oracle.lat) > drift).view(np.uint8)
+        lon_bad = (np.abs(observed.lon - oracle.lon) > drift).view(np.uint8)
+        stale = ((oracle.ts_ns - observed.ts_ns) > self._max_age_ns).view(np.uint8)
+        return lat_bad | (lon_bad << np.uint8(1)) | (stale << np.uint8(2))
+
+    def verify_batch(self, observed: TelemetryBatch, oracle: TelemetryBatch) -> Any:
+        """Boolean mask of compliant rows."""
+        return self.reason_codes(observed, oracle) == 0
+
+
+# The harness components are stateless, so run_harness reuses one instance
+# of each instead of rebuilding them per call.
+_ORACLE = TrustedOracle()
+_POLICY = CompliancePolicy()
+_SPOOFER = FakeGPSSpoofer()
+_REPLAY = SensorReplay()
 
 
 def run_harness() -> Dict[str, Tuple[bool, str]]:
-    oracle = TrustedOracle().read()
-    policy = CompliancePolicy()
-
-    baseline = oracle
-    spoofed = FakeGPSSpoofer().apply(oracle)
-    replayed = SensorReplay().apply(oracle)
-
-    return {
-        "baseline": policy.verify(baseline, oracle),
-        "gps_spoof": policy.verify(spoofed, oracle),
-        "sensor_replay": policy.verify(replayed, oracle),
+    oracle = _ORACLE.read()
+    results = {
+        "baseline": _POLICY.verify(oracle, oracle),
+        "gps_spoof": _POLICY.verify(_SPOOFER.apply(oracle), oracle),
+        "sensor_replay": _POLICY.verify(_REPLAY.apply(oracle), oracle),
     }
+    return {scenario: (ok, reason.name) for scenario, (ok, reason) in results.items()}
 
 
 if __name__ == "__main__":
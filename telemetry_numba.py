@@ -0,0 +1,57 @@
+"""Numba kernels for batched telemetry verification.
+
+Optional accelerator for ``sensor_spoofing_harness.CompliancePolicy``: the
+drift and staleness comparisons are fused into one compiled pass that writes
+the int8 reason code directly, instead of materializing several temporary
+mask arrays. A serial and a ``prange`` variant are compiled; both are cached
+on disk (``cache=True``) to avoid the JIT cost on every process start.
+
+Requires ``numpy`` and ``numba``; importing this module raises ImportError
+when either is missing, which callers treat as "backend unavailable".
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import config, njit, prange
+
+# Every fastmath flag except nnan/ninf, so NaN coordinates compare exactly as
+# they do on the numpy and scalar paths.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+# Below this many rows, thread fan-out costs more than the fused loop saves.
+_PARALLEL_MIN_ROWS = 65536
+
+
+@njit(cache=True, fastmath=_FASTMATH)
+def _verify_kernel(lat, lon, ts_ns, o_lat, o_lon, o_ts_ns, drift, max_age_ns, out):
+    for i in range(lat.shape[0]):
+        if abs(lat[i] - o_lat[i]) > drift or abs(lon[i] - o_lon[i]) > drift:
+            out[i] = 1
+        elif o_ts_ns[i] - ts_ns[i] > max_age_ns:
+            out[i] = 2
+        else:
+            out[i] = 0
+
+
+@njit(cache=True, fastmath=_FASTMATH, parallel=True)
+def _verify_kernel_parallel(lat, lon, ts_ns, o_lat, o_lon, o_ts_ns, drift, max_age_ns, out):
+    for i in prange(lat.shape[0]):
+        if abs(lat[i] - o_lat[i]) > drift or abs(lon[i] - o_lon[i]) > drift:
+            out[i] = 1
+        elif o_ts_ns[i] - ts_ns[i] > max_age_ns:
+            out[i] = 2
+        else:
+            out[i] = 0
+
+
+def reason_codes(lat, lon, ts_ns, o_lat, o_lon, o_ts_ns, drift: float, max_age_ns: int) -> np.ndarray:
+    """int8 reason code per row; oracle columns may be length 1 and are broadcast."""
+    n = lat.shape[0]
+    o_lat = np.broadcast_to(o_lat, (n,))
+    o_lon = np.broadcast_to(o_lon, (n,))
+    o_ts_ns = np.broadcast_to(o_ts_ns, (n,))
+    out = np.empty(n, dtype=np.int8)
+    kernel = _verify_kernel_parallel if n >= _PARALLEL_MIN_ROWS and config.NUMBA_NUM_THREADS > 1 else _verify_kernel
+    kernel(lat, lon, ts_ns, o_lat, o_lon, o_ts_ns, drift, max_age_ns, out)
+    return out
@@ -1,17 +1,42 @@
+import importlib.util
+import os
 import unittest
+import uuid
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from unittest import mock
 
+import blockchain_compliance_protocol
 from blockchain_compliance_protocol import (
     AttestationPayload,
+    Block,
     Blockchain,
+    BlockHeader,
     ComplianceChecker,
     ComplianceResult,
     DemoComplianceChecker,
     HonestyEscrow,
+    IncrementalMerkle,
+    canonical_serialize,
+    compliance_hash,
+    merkle_root,
     mine_compliant_block,
     verify_attestation_payload,
 )
-from sensor_spoofing_harness import run_harness
+from onecode_v1 import RainbowJobsOneCode
+from sensor_spoofing_harness import (
+    CompliancePolicy,
+    FLAG_LAT_DRIFT,
+    FLAG_LON_DRIFT,
+    FLAG_STALE,
+    FakeGPSSpoofer,
+    Reason,
+    SensorReplay,
+    TelemetryBatch,
+    TrustedOracle,
+    run_harness,
+)
 
 
 class RejectingChecker(ComplianceChecker):
@@ -46,6 +71,140 @@ class ProtocolTests(unittest.TestCase):
         self.assertTrue(ok)
         self.assertEqual(reason, "CHAIN_VALID")
 
+    def test_mine_uses_one_pinned_clock_reading(self) -> None:
+        pinned = datetime(2020, 3, 1, 12, 0, tzinfo=timezone.utc)
+        chain = Blockchain()
+        block = mine_compliant_block(chain, [{"from": "A", "to": "B", "amount": 1}], now_utc=pinned)
+        self.assertEqual(block.header.timestamp_utc, pinned.isoformat())
+        evidence = DemoComplianceChecker().perform_check(now_utc=pinned).evidence
+        self.assertEqual(evidence["attestation"]["timestamp_utc"], pinned.isoformat())
+        self.assertEqual(block.header.compliance_data_hash, compliance_hash(evidence))
+
+    def test_add_block_rejects_hashed_block_without_parent(self) -> None:
+        chain = Blockchain()
+        txs = [{"from": "A", "to": "B", "amount": 1}]
+        header = BlockHeader(
+            index=1,
+            timestamp_utc="2024-01-01T00:00:00+00:00",
+            previous_hash="",
+            transaction_merkle_root=merkle_root(txs),
+            compliance_data_hash="0",
+            nonce=0,
+        )
+        block = Block(header=header, transactions=txs)
+        block.block_hash = block.calculate_hash()
+        with self.assertRaises(ValueError):
+            chain.add_block(block)
+        self.assertEqual(len(chain.chain), 1)
+
+    def test_parallel_validation_reports_first_failure(self) -> None:
+        chain = Blockchain()
+        for i in range(6):
+            mine_compliant_block(chain, [{"from": "A", "to": "B", "amount": i}], DemoComplianceChecker())
+        chain.chain[4].transactions.append({"from": "X", "to": "Y", "amount": 99})
+        chain.chain[2].header.nonce = 7
+
+        with mock.patch.object(blockchain_compliance_protocol, "PARALLEL_VALIDATION_MIN_BLOCKS", 2):
+            self.assertEqual(chain.validate_chain(workers=2), (False, "HASH_MISMATCH_AT_2"))
+        self.assertEqual(chain.validate_chain(workers=1), (False, "HASH_MISMATCH_AT_2"))
+
+    def test_header_canonical_bytes_match_serializer(self) -> None:
+        chain = Blockchain()
+        block = mine_compliant_block(chain, [{"from": "A", "to": "B", "amount": 1}], DemoComplianceChecker())
+        header = block.header
+        fields = asdict(header)
+        nonce = fields.pop("nonce")
+
+        expected = canonical_serialize(fields) + str(nonce).encode("ascii")
+        self.assertEqual(header.canonical_bytes(), expected)
+        self.assertEqual(block.block_hash, sha256(expected).hexdigest())
+
+    def test_incremental_merkle_matches_merkle_root(self) -> None:
+        for n in range(0, 18):
+            txs = [{"from": "A", "to": "B", "amount": i} for i in range(n)]
+            acc = IncrementalMerkle()
+            for tx in txs:
+                acc.append_transaction(tx)
+            self.assertEqual(acc.root(), merkle_root(txs), n)
+
+    def test_mine_pending_transactions(self) -> None:
+        chain = Blockchain()
+        for i in range(5):
+            chain.add_transaction({"from": "A", "to": "B", "amount": i})
+        with mock.patch.object(blockchain_compliance_protocol, "merkle_root", wraps=merkle_root) as full_root:
+            block = mine_compliant_block(chain, checker=DemoComplianceChecker())
+        full_root.assert_not_called()
+        self.assertEqual(len(block.transactions), 5)
+        self.assertEqual(chain.pending_transactions, [])
+        self.assertEqual(chain.validate_chain(), (True, "CHAIN_VALID"))
+
+    def test_mine_pending_ignores_later_edits_to_queued_transactions(self) -> None:
+        chain = Blockchain()
+        tx = {"from": "A", "to": "B", "amount": 1}
+        chain.add_transaction(tx)
+        tx["amount"] = 1_000_000
+        chain.pending_transactions.append({"from": "X", "to": "Y", "amount": 2})
+        block = mine_compliant_block(chain, checker=DemoComplianceChecker())
+        self.assertEqual(block.transactions, [{"from": "A", "to": "B", "amount": 1}])
+        self.assertEqual(chain.validate_chain(), (True, "CHAIN_VALID"))
+
+    @unittest.skipUnless(importlib.util.find_spec("numba"), "numba not installed")
+    def test_numba_pair_kernel_matches_hashlib(self) -> None:
+        import numpy as np
+        from merkle_sha256_numba import _PAD_W, _expand, hash_pairs_bytes
+
+        buf = os.urandom(64 * 37)
+        expected = b"".join(sha256(buf[i : i + 64]).digest() for i in range(0, len(buf), 64))
+        self.assertEqual(hash_pairs_bytes(buf), expected)
+
+        schedule = np.zeros(64, dtype=np.uint64)
+        schedule[0], schedule[15] = 0x80000000, 512
+        _expand(schedule)
+        self.assertEqual(schedule.tolist(), _PAD_W.tolist())
+
+    def test_serializer_matches_stdlib_on_exponent_and_non_finite_floats(self) -> None:
+        payloads = [
+            {"amount": 1e-05},
+            {"amount": 1e16},
+            {"amount": float("nan")},
+            {"amount": float("-inf")},
+            {"legs": [{"amount": -2.5e-7}, {"amount": 0.5}], "fee": 1.5e20},
+            [0.0, -0.0, 1e-4, 9.99e15],
+        ]
+        for payload in payloads:
+            with self.subTest(payload=payload):
+                self.assertEqual(
+                    blockchain_compliance_protocol._dumps(payload),
+                    blockchain_compliance_protocol._json_dumps(payload),
+                )
+
+    def test_serializer_rejects_types_the_stdlib_encoder_rejects(self) -> None:
+        for value in (datetime(2024, 1, 1, tzinfo=timezone.utc), uuid.UUID(int=1), ComplianceResult(True, "OK", {})):
+            with self.subTest(value=value):
+                with self.assertRaises(TypeError):
+                    blockchain_compliance_protocol._json_dumps({"v": value})
+                with self.assertRaises(TypeError):
+                    canonical_serialize({"v": value})
+
+    def test_pair_hasher_self_test_rejects_foreign_backends(self) -> None:
+        sound = blockchain_compliance_protocol._pair_hasher_is_sound
+        self.assertTrue(sound(blockchain_compliance_protocol._hash_pairs_hashlib))
+        self.assertFalse(sound(None))
+        self.assertFalse(sound(lambda buf: sha256(buf).digest()))
+        self.assertFalse(sound(lambda buf: buf.hex()))
+
+    def test_compliance_hash_is_pinned(self) -> None:
+        evidence = {
+            "flags": [1, None, True],
+            "attestation_digest": "abc",
+            "attestation": {"uv_index": 6, "signer": "é", "latitude": 49.2827, "device_id": "d1"},
+        }
+        self.assertEqual(
+            compliance_hash(evidence),
+            "b4bb928a28e5458220e78f26e3a7ebdc9f1d44b99c6e3a23e28537fa2f5127e6",
+        )
+        self.assertEqual(compliance_hash({1: "a"}), sha256(canonical_serialize({1: "a"})).hexdigest())
+
     def test_rejecting_checker_raises(self) -> None:
         chain = Blockchain()
         with self.assertRaises(RuntimeError):
@@ -69,12 +228,93 @@ class ProtocolTests(unittest.TestCase):
         slashed, victim = escrow.slash_and_reimburse(block_height=2, victim="victim")
         self.assertEqual((slashed, victim), (expected_slashed, "victim"))
 
+    def test_escrow_release_time_uses_pinned_clock(self) -> None:
+        pinned = datetime(2020, 3, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)
+        escrow = HonestyEscrow()
+        rec = escrow.create_escrow(notary="n1", reward_amount=1000, block_height=1, now_utc=pinned)
+        self.assertEqual(rec.release_timestamp_utc, pinned + timedelta(days=365 * 5))
+        self.assertEqual(escrow.matured_heights(now_utc=rec.release_timestamp_utc), [1])
+
+    def test_escrow_columns_track_out_of_order_heights(self) -> None:
+        escrow = HonestyEscrow()
+        now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        for height in (5, 2, 9):
+            escrow.create_escrow(notary=f"n{height}", reward_amount=100, block_height=height, now_utc=now)
+        escrow.slash_and_reimburse(block_height=2, victim="victim")
+
+        self.assertEqual(len(escrow), 3)
+        self.assertTrue(escrow.get_record(2).is_slashed)
+        self.assertEqual(escrow.get_record(9).notary, "n9")
+        matured = now + timedelta(days=365 * 5)
+        self.assertEqual(escrow.matured_heights(now_utc=matured), [5, 9])
+        with self.assertRaises(KeyError):
+            escrow.get_record(3)
+
+    def test_resonance_synthesis_picks_are_pinned(self) -> None:
+        ai = RainbowJobsOneCode()
+        self.assertEqual(
+            ai.resonance_synthesis("Develop the Miracle Network"),
+            "The concept of 'develop' connects the architecture of FastAPI GitHub Pusher."
+            "\n\n--- Watermark: LTAiCollab ---",
+        )
+        self.assertEqual(
+            ai.resonance_synthesis("social mining", 0.2),
+            "The concept of 'wealth redistribution' connects the architecture of IoT Crestron."
+            "\n\n--- Watermark: LTAiCollab ---",
+        )
+
+    def test_resonance_synthesis_batch_matches_single_calls(self) -> None:
+        ai = RainbowJobsOneCode()
+        prompts = ["Develop the Miracle Network", "social mining", "", "Develop the Miracle Network"]
+        creativities = [0.7, 0.2, 0.9, 0.1]
+        self.assertEqual(
+            ai.resonance_synthesis_batch(prompts, creativities),
+            [ai.resonance_synthesis(p, c) for p, c in zip(prompts, creativities)],
+        )
+        self.assertEqual(ai.resonance_synthesis_batch(prompts), [ai.resonance_synthesis(p) for p in prompts])
+        with self.assertRaises(ValueError):
+            ai.resonance_synthesis_batch(prompts, creativities[:2])
+
     def test_spoofing_harness(self) -> None:
         results = run_harness()
         self.assertEqual(results["baseline"], (True, "COMPLIANT"))
         self.assertEqual(results["gps_spoof"], (False, "GPS_DRIFT_EXCEEDED"))
         self.assertEqual(results["sensor_replay"], (False, "STALE_TELEMETRY"))
 
+    def test_oracle_uses_injected_clock(self) -> None:
+        ticks = iter([1_700_000_000_000_000_000, 1_700_000_000_000_001_000])
+        oracle = TrustedOracle(clock=lambda: next(ticks))
+        first = oracle.read()
+        self.assertEqual(first.timestamp_ns, 1_700_000_000_000_000_000)
+        self.assertEqual(first.timestamp_utc, datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc))
+        self.assertEqual(oracle.read().timestamp_ns - first.timestamp_ns, 1_000)
+
+    @unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy not installed")
+    def test_batch_harness_matches_scalar_verify(self) -> None:
+        oracle = TrustedOracle().read()
+        policy = CompliancePolicy()
+        rows = [oracle, FakeGPSSpoofer().apply(oracle), SensorReplay().apply(oracle)]
+        oracle_batch = TelemetryBatch.from_rows([oracle] * len(rows))
+
+        observed = TelemetryBatch.from_rows(rows)
+        self.assertEqual(
+            policy.verify_batch(observed, oracle_batch).tolist(),
+            [policy.verify(row, oracle)[0] for row in rows],
+        )
+        self.assertEqual(
+            [Reason(code) for code in policy.reason_codes(observed, oracle_batch).tolist()],
+            [policy.verify(row, oracle)[1] for row in rows],
+        )
+        both = SensorReplay().apply_batch(FakeGPSSpoofer().apply_batch(TelemetryBatch.from_rows([oracle])))
+        self.assertEqual(
+            policy.failure_flags(both, TelemetryBatch.from_rows([oracle])).tolist(),
+            [FLAG_LAT_DRIFT | FLAG_LON_DRIFT | FLAG_STALE],
+        )
+        spoofed = FakeGPSSpoofer().apply_batch(TelemetryBatch.from_rows([oracle]))
+        self.assertEqual(policy.verify(spoofed.row(0), oracle), (False, Reason.GPS_DRIFT_EXCEEDED))
+        replayed = SensorReplay().apply_batch(TelemetryBatch.from_rows([oracle]))
+        self.assertEqual(policy.verify(replayed.row(0), oracle), (False, Reason.STALE_TELEMETRY))
+
 
 if __name__ == "__main__":
     unittest.main()